@@ -1,6 +1,12 @@
+import functools
 import importlib.util
 import pytest
 from src.components.fact_storage import KnowledgeGraph
+from src.components.relation_extraction import (
+    RelationExtractorOpenIE,
+    RelationExtractorREBEL,
+    RelationExtractorTextacy
+)
 from src.connectors.document import DocumentConnector
 from src.connectors.graph import GraphConnector
 from src.connectors.relational import RelationalConnector
@@ -21,10 +27,18 @@ def optional_param(name: str, package: str) -> Any:  # ParameterSet is internal
     @param name  The fixture name to include in the parameter list.
     @param package  The name of a Python package to check for.
     @return  PyTest parameter with the skip flag set if package is not installed."""
-    exists = importlib.util.find_spec(package) is not None
+    exists = _package_available(package)
     return pytest.param(name, marks=pytest.mark.skipif(not exists, reason=f"{package} not installed"))
 
 
+@functools.lru_cache(maxsize=None)
+def _package_available(package: str) -> bool:
+    """Check whether a package can be imported, probing sys.path once per package name.
+    @param package  The name of a Python package to check for.
+    @return  True if the package is installed."""
+    return importlib.util.find_spec(package) is not None
+
+
 @pytest.fixture(scope="session", autouse=True)
 def session(request: pytest.FixtureRequest) -> Generator[Session, None, None]:
     """Fixture to create session.
@@ -85,3 +99,26 @@ def main_graph(request: pytest.FixtureRequest, graph_db: GraphConnector, session
         graph_db.drop_graph(graph_name)
     with graph_db.temp_graph(graph_name):
         yield _main_graph
+
+
+# ------------------------------------------------------------------------------
+# MODEL FIXTURES: Share relation extractors so models load once per test run.
+# ------------------------------------------------------------------------------
+@pytest.fixture(scope="session")
+def rebel_extractor() -> RelationExtractorREBEL:
+    """Fixture to get a REBEL extractor. The model is lazy-loaded on the first extract() call."""
+    return RelationExtractorREBEL()
+
+
+@pytest.fixture(scope="session")
+def openie_extractor() -> Generator[RelationExtractorOpenIE, None, None]:
+    """Fixture to get an OpenIE extractor. The CoreNLP server starts on the first extract() call and stays up until teardown."""
+    extractor = RelationExtractorOpenIE(keep_alive=True)
+    yield extractor
+    extractor.close()
+
+
+@pytest.fixture(scope="session")
+def textacy_extractor() -> RelationExtractorTextacy:
+    """Fixture to get a Textacy extractor. The spaCy model is lazy-loaded on the first extract() call."""
+    return RelationExtractorTextacy()
@@ -1,25 +1,30 @@
 from conftest import optional_param
+import functools
+from pathlib import Path
 import pytest
 from src.components.book_conversion import Chunk
 from src.core.stages import *
 from src.main import pipeline_B, pipeline_D, pipeline_E
-from typing import Any, List
+from typing import Any, Callable, Dict, List, Tuple
 
 
-@pytest.fixture
-def book_data():
-    """Minimal data for smoke tests - mirrors book_2 structure"""
-    chunk_id = "story-2_book-2_chapter-1_p.25000"
+# Keep every test in this module on one xdist worker (--dist loadgroup):
+#   the session-scoped extractors load once, and pytest-dependency can see the upstream results.
+pytestmark = pytest.mark.xdist_group("models")
+
 
-    chunk_path = f"./tests/examples-pipeline/chunks/{chunk_id}.txt"
-    triples_path = f"./tests/examples-pipeline/triples/{chunk_id}.json"
+## Example chunk shared by the smoke tests - resolved once at import, read lazily by _load_example_chunk.
+EXAMPLE_CHUNK_ID = "story-2_book-2_chapter-1_p.25000"
+EXAMPLE_CHUNK_PATH = Path(f"./tests/examples-pipeline/chunks/{EXAMPLE_CHUNK_ID}.txt")
+EXAMPLE_TRIPLES_PATH = Path(f"./tests/examples-pipeline/triples/{EXAMPLE_CHUNK_ID}.json")
 
-    # Read chunk text and triples from files
-    with open(chunk_path, 'r') as f:
-        chunk_text = f.read()
 
-    with open(triples_path, 'r') as f:
-        llm_triples_json = f.read()
+@functools.lru_cache(maxsize=1)
+def _load_example_chunk() -> Tuple[Chunk, str]:
+    """Read the example chunk text and LLM triples from disk once per process.
+    @return  The example Chunk, and the raw LLM triples JSON string."""
+    chunk_text = EXAMPLE_CHUNK_PATH.read_text(encoding="utf-8")
+    llm_triples_json = EXAMPLE_TRIPLES_PATH.read_text(encoding="utf-8")
 
     chunk = Chunk(
         chunk_text,
@@ -31,6 +36,14 @@ def book_data():
         story_percent=8.0,
         chapter_percent=25.0,
     )
+    return chunk, llm_triples_json
+
+
+@pytest.fixture(scope="session")
+def book_data():
+    """Minimal data for smoke tests - mirrors book_2 structure.
+    @note  Session-scoped: tests only read from this dict, so the files are loaded once per run."""
+    chunk, llm_triples_json = _load_example_chunk()
 
     return {
         "book_id": 1,
@@ -57,21 +70,21 @@ def book_data():
 
 
 @pytest.fixture
-def rebel():
-    """Fixture returning the REBEL extraction function."""
-    return task_12_relation_extraction_rebel
+def rebel(rebel_extractor):
+    """Fixture returning the REBEL extraction function, bound to the session-scoped extractor."""
+    return functools.partial(task_12_relation_extraction_rebel, nlp=rebel_extractor)
 
 
 @pytest.fixture
-def openie():
-    """Fixture returning the OpenIE extraction function."""
-    return task_12_relation_extraction_openie
+def openie(openie_extractor):
+    """Fixture returning the OpenIE extraction function, bound to the session-scoped extractor."""
+    return functools.partial(task_12_relation_extraction_openie, nlp=openie_extractor)
 
 
 @pytest.fixture
-def textacy():
-    """Fixture returning the Textacy extraction function."""
-    return task_12_relation_extraction_textacy
+def textacy(textacy_extractor):
+    """Fixture returning the Textacy extraction function, bound to the session-scoped extractor."""
+    return functools.partial(task_12_relation_extraction_textacy, nlp=textacy_extractor)
 
 
 @pytest.fixture
@@ -80,29 +93,31 @@ def relation_extraction_task(request):
     return request.getfixturevalue(request.param)
 
 
+@pytest.fixture
+def relation_extractor(request):
+    """Meta-fixture that returns the session-scoped extractor object for the backend named by the parameter."""
+    return request.getfixturevalue(f"{request.param}_extractor")
+
+
+# Ordered cheapest first, so a regression fails fast (-x) before the REBEL weights or the CoreNLP server load.
 PARAMS_RELATION_EXTRACTORS: List[Any] = [  # ParameterSet is internal to PyTest
+    pytest.param("textacy"),  # test always runs (no dependency)
     optional_param("rebel", "transformers"),
     optional_param("openie", "stanza"),
-    pytest.param("textacy"),  # test always runs (no dependency)
 ]
 
 
-@pytest.fixture
-def langchain():
-    """Fixture returning the LangChain LLM API."""
-    return task_14_relation_extraction_llm_langchain
-
-
-@pytest.fixture
-def openai():
-    """Fixture returning the OpenAI LLM API."""
-    return task_14_relation_extraction_llm_openai
+## LLM backends keyed by parameter name. These need no setup, so a plain lookup replaces per-backend fixtures.
+LLM_PROMPT_TASKS: Dict[str, Callable[..., Any]] = {
+    "langchain": task_14_relation_extraction_llm_langchain,
+    "openai": task_14_relation_extraction_llm_openai,
+}
 
 
 @pytest.fixture
 def llm_prompt_task(request):
     """Meta-fixture that returns the backend function specified by the parameter."""
-    return request.getfixturevalue(request.param)
+    return LLM_PROMPT_TASKS[request.param]
 
 
 @pytest.mark.task
@@ -153,6 +168,25 @@ def test_job_12_extraction(book_data, relation_extraction_task):
         assert isinstance(obj, str) and len(obj) > 0
 
 
+@pytest.mark.task
+@pytest.mark.stage_B
+@pytest.mark.re
+@pytest.mark.smoke
+@pytest.mark.order(12)
+@pytest.mark.dependency(name="job_12_extraction_batch", scope="session", depends=["job_12_extraction_minimal"])
+@pytest.mark.parametrize("relation_extractor", PARAMS_RELATION_EXTRACTORS, indirect=True)
+def test_job_12_extraction_batch(relation_extractor):
+    """Verify extract_batch returns one list of Triples per input text, in input order.
+    @note  Short texts only: the full chunk is already covered by test_job_12_extraction, so its inference is not repeated here."""
+    texts = ["Alice met Bob in the forest. Bob then went to the village.", "The Phoenix hatched from the egg."]
+    batched = relation_extractor.extract_batch(texts)
+
+    assert isinstance(batched, list)
+    assert len(batched) == len(texts)
+    for extracted in batched:
+        assert all(set(triple) == {"s", "r", "o"} for triple in extracted), "Triple must have keys 's', 'r', and 'o'"
+
+
 @pytest.mark.task
 @pytest.mark.stage_B
 @pytest.mark.llm
@@ -200,7 +234,7 @@ def test_pipeline_B_minimal(docs_db, book_data):
     # Verify chunk was inserted into MongoDB
     mongo_db = docs_db.get_unmanaged_handle()
     collection = getattr(mongo_db, collection_name)
-    doc = collection.find_one({"_id": chunk.get_chunk_id()})
+    doc = collection.find_one({"_id": chunk.get_chunk_id()}, {"book_title": 1})
     assert doc is not None
     assert doc["book_title"] == book_title
 
@@ -227,7 +261,7 @@ def test_pipeline_D_minimal(docs_db, book_data):
     # Verify summary was written to MongoDB
     mongo_db = docs_db.get_unmanaged_handle()
     collection = getattr(mongo_db, collection_name)
-    doc = collection.find_one({"_id": chunk.get_chunk_id()})
+    doc = collection.find_one({"_id": chunk.get_chunk_id()}, {"summary": 1})
     assert doc is not None
     assert doc["summary"] == summary
 
@@ -1,66 +1,223 @@
-import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
+import functools
+from importlib.util import find_spec
+import numpy as np
 import os
 import pandas as pd
-import seaborn as sns
 from src.util import Log
-from typing import Optional
+from typing import Any, Iterator, Optional, Tuple, TYPE_CHECKING
+
+
+# Forward references for lazy-loaded modules
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 
 class Plot:
     """Static plotting helpers for visualization."""
 
+    ## Columns read from timing CSVs - call_chain and any extra fields are never parsed.
+    TIMING_COLUMNS = ['run_id', 'function', 'elapsed']
+    ## Low-cardinality keys are stored as categoricals, and elapsed seconds do not need float64 precision.
+    TIMING_DTYPES = {'run_id': 'category', 'function': 'category', 'elapsed': 'float32'}
+    ## Row count at which _mean_per_function switches from pandas groupby to the fused bincount kernel.
+    FUSED_MEAN_MIN_ROWS = 100_000
+    ## Largest n_runs x n_functions grid the fused kernel may allocate before falling back to groupby.
+    FUSED_MEAN_MAX_CELLS = 10_000_000
+
+    @staticmethod
+    def _new_figure(**kwargs: Any) -> "Figure":
+        """Create a standalone figure, importing matplotlib on first use.
+        @details  The figure is never registered with pyplot, so no backend or GUI toolkit is initialized,
+            nothing accumulates in pyplot's global figure manager, and the figure is freed once the caller drops it.
+            Saving to a file renders through Agg.
+        @param kwargs  Passed to matplotlib.figure.Figure, e.g. figsize
+        @return  A new empty Figure.
+        """
+        from matplotlib.figure import Figure
+
+        return Figure(**kwargs)
+
+    @staticmethod
+    def _save(fig: "Figure", title: str, filename: str) -> None:
+        """Write a figure to disk and log the chart.
+        @details  The image is encoded into a 1 MiB write buffer, so it reaches the file in a few large writes.
+        @param fig  The figure to save
+        @param title  Chart title for the log message
+        @param filename  Where to save the chart. The extension selects the image format.
+        """
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        image_format = os.path.splitext(filename)[1].lstrip('.') or 'png'
+        with open(filename, 'wb', buffering=1 << 20) as f:
+            fig.savefig(f, format=image_format, dpi=100)
+        Log.chart(title, filename)
+
+    @staticmethod
+    def _mean_per_function(df: pd.DataFrame) -> pd.Series:
+        """Average elapsed time per function, weighting each run equally.
+        @details  Calls are averaged within each run first, then across runs. The group keys are
+            low-cardinality categoricals, elapsed is downcast to TIMING_DTYPES, and both passes share
+            one MultiIndex, so no intermediate reset_index() copy is made.
+        @param df  DataFrame with columns 'run_id', 'function', and 'elapsed'
+        @return  Series of average elapsed time, indexed by function name
+        """
+        keys = df[['run_id', 'function']].astype('category')
+        elapsed = df['elapsed'].astype(Plot.TIMING_DTYPES['elapsed'])
+        if len(df) >= Plot.FUSED_MEAN_MIN_ROWS:
+            fused = Plot._fused_mean_per_function(keys['run_id'].cat, keys['function'].cat, elapsed.to_numpy())
+            if fused is not None:
+                return fused
+        per_run_avg = elapsed.groupby([keys['run_id'], keys['function']], observed=True, sort=False).mean()
+        # Sorting the few function groups is cheap, and keeps the bar order stable
+        return per_run_avg.groupby(level='function', observed=True).mean()
+
+    @staticmethod
+    def _fused_mean_per_function(runs: Any, functions: Any, elapsed: np.ndarray) -> Optional[pd.Series]:
+        """Mean of per-run means in one pass over the categorical codes, without pandas groupby.
+        @details  Every (run, function) pair maps to one cell of a dense n_runs x n_functions grid.
+            Two np.bincount scans accumulate the sums and counts per cell, and the per-function
+            average is taken over the cells that were observed.
+        @param runs  Categorical accessor (Series.cat) of the run ids
+        @param functions  Categorical accessor (Series.cat) of the function names
+        @param elapsed  Elapsed seconds, aligned with the codes
+        @return  Series of average elapsed time indexed by function name, matching _mean_per_function,
+            or None if the grid would be larger than FUSED_MEAN_MAX_CELLS.
+        """
+        n_runs, n_functions = len(runs.categories), len(functions.categories)
+        if n_runs * n_functions > Plot.FUSED_MEAN_MAX_CELLS:
+            return None
+
+        # Missing keys have code -1; groupby drops them too
+        run_codes, function_codes = runs.codes.to_numpy(), functions.codes.to_numpy()
+        valid = (run_codes >= 0) & (function_codes >= 0)
+        cells = run_codes[valid].astype(np.int64) * n_functions + function_codes[valid]
+        sums = np.bincount(cells, weights=elapsed[valid], minlength=n_runs * n_functions).reshape(n_runs, n_functions)
+        counts = np.bincount(cells, minlength=n_runs * n_functions).reshape(n_runs, n_functions)
+
+        observed = counts > 0
+        per_run_avg = np.divide(sums, counts, out=np.zeros_like(sums), where=observed)
+        runs_per_function = observed.sum(axis=0)
+        keep = runs_per_function > 0
+        overall = per_run_avg.sum(axis=0)[keep] / runs_per_function[keep]
+        index = pd.Index(functions.categories[keep], name='function')
+        return pd.Series(overall.astype(Plot.TIMING_DTYPES['elapsed']), index=index, name='elapsed')
+
+    @staticmethod
+    def _overall_avg(file_path: str = "./logs/elapsed_time.csv") -> pd.DataFrame:
+        """Average elapsed time per function over Log.get_merged_timing(), reused until the timing data changes.
+        @param file_path  Timing CSV merged by Log.get_merged_timing()
+        @return  DataFrame with columns 'function' and 'elapsed'. Shared between calls, so do not modify it.
+        """
+        mtime = os.path.getmtime(file_path) if os.path.exists(file_path) else None
+        return Plot._overall_avg_cached(file_path, mtime, Log.get_timing_state())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _overall_avg_cached(file_path: str, mtime: Optional[float], timing_state: Tuple[Any, ...]) -> pd.DataFrame:
+        """Cached body of _overall_avg.
+        @param file_path  Timing CSV merged by Log.get_merged_timing()
+        @param mtime  Modification time of file_path, or None if it does not exist, so a rewritten CSV invalidates the cache
+        @param timing_state  Log.get_timing_state(), so newly recorded or cleared timings invalidate the cache
+        @note  Apart from file_path, the arguments are only the cache key - the data itself comes from Log.get_merged_timing().
+        """
+        df = Log.get_merged_timing(file_path)  # DataFrame with columns ['function', 'elapsed', 'call_chain', 'run_id']
+        return Plot._mean_per_function(df).reset_index()
+
+    @staticmethod
+    def _iter_timing_chunks(path: str, chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+        """Parse a timing CSV one chunk at a time, keeping only TIMING_COLUMNS.
+        @details  Uses the multi-threaded pyarrow streaming reader when pyarrow is installed,
+            and falls back to the pandas C parser otherwise. Both yield the same dtypes.
+        @param path  Path to a timing CSV
+        @param chunksize  Rows per chunk for the pandas parser. The pyarrow reader uses its own block size.
+        @return  Iterator over DataFrames with columns 'run_id', 'function', and 'elapsed'
+        """
+        if find_spec("pyarrow") is None:
+            yield from pd.read_csv(path, usecols=Plot.TIMING_COLUMNS, dtype=Plot.TIMING_DTYPES, engine='c', chunksize=chunksize)
+            return
+
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+
+        # Keys are read as strings and categorized per batch, so categories sort the same way as the pandas parser's
+        convert_options = pacsv.ConvertOptions(
+            include_columns=Plot.TIMING_COLUMNS,
+            column_types={'run_id': pa.string(), 'function': pa.string(), 'elapsed': pa.float32()},
+        )
+        with pacsv.open_csv(path, convert_options=convert_options) as reader:
+            for batch in reader:
+                yield batch.to_pandas().astype(Plot.TIMING_DTYPES)
+
+    @staticmethod
+    def _stream_run_means(path: str, only_pipeline: Optional[bool] = None, chunksize: int = 100_000) -> pd.Series:
+        """Average elapsed time per (run_id, function) from a timing CSV, without loading the whole file.
+        @details  Each chunk is reduced to partial sums and counts before the next one is parsed,
+            so peak memory is bounded by the chunk size rather than the file size.
+        @param path  Path to a timing CSV with columns 'run_id', 'function', and 'elapsed'
+        @param only_pipeline  Keep only functions containing "pipeline" (True), exclude them (False), or keep both (None)
+        @param chunksize  Number of rows parsed per chunk
+        @return  Series named 'elapsed', indexed by ('run_id', 'function')
+        """
+        partials = []
+        for chunk in Plot._iter_timing_chunks(path, chunksize):
+            # Choose or exclude functions containing "pipeline"
+            if only_pipeline is not None:
+                # Match only the distinct names, then broadcast to rows through the categorical codes (-1 = missing)
+                functions = chunk['function'].cat
+                is_pipeline_name = functions.categories.str.contains('pipeline', case=False, regex=False)
+                is_pipeline = np.append(is_pipeline_name, False)[functions.codes.to_numpy()]
+                chunk = chunk[is_pipeline if only_pipeline else ~is_pipeline]
+            partials.append(chunk.groupby(['run_id', 'function'], observed=True, sort=False)['elapsed'].agg(['sum', 'count']))
+
+        if not partials:
+            empty = pd.MultiIndex.from_arrays([[], []], names=['run_id', 'function'])
+            return pd.Series([], index=empty, name='elapsed', dtype='float64')
+        totals = pd.concat(partials).groupby(level=['run_id', 'function'], sort=False).sum()
+        return (totals['sum'] / totals['count']).rename('elapsed')
+
     @staticmethod
     def time_elapsed_horizontal(filename: str = "./logs/charts/avg_runtime.png") -> None:
         """Plot average elapsed time per function name, averaging across runs.
         @param filename  Where to save the generated chart
         """
-        df = Log.get_merged_timing()  # DataFrame with columns ['function', 'elapsed', 'call_chain', 'run_id']
-        # 1. Average per-run per-function (handles multiple calls in a run)
-        per_run_avg = df.groupby(['run_id', 'function'])['elapsed'].mean().reset_index()
+        # 1. Average per-run per-function (handles multiple calls in a run), then across all runs
+        overall_avg = Plot._overall_avg()
 
-        # 2. Average across all runs
-        overall_avg = per_run_avg.groupby('function')['elapsed'].mean().reset_index()
-
-        # 3. Plot
+        # 2. Plot
         title = "Average Function Runtime Across Runs"
-        sns.barplot(data=overall_avg, x='function', y='elapsed')
-        plt.xticks(rotation=45, ha='right')
-        plt.ylabel("Average elapsed time")
-        plt.xlabel("Function name")
-        plt.title(title)
-        plt.tight_layout()
-
-        # 4. Save the figure
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        plt.savefig(filename)
-        plt.close()
-        Log.chart(title, filename)
+        fig = Plot._new_figure(layout='constrained')
+        ax = fig.subplots()
+        ax.bar(overall_avg['function'].astype(str), overall_avg['elapsed'])
+        ax.tick_params(axis='x', labelrotation=45)
+        for label in ax.get_xticklabels():
+            label.set_horizontalalignment('right')
+        ax.set_ylabel("Average elapsed time")
+        ax.set_xlabel("Function name")
+        ax.set_title(title)
+
+        # 3. Save the figure
+        Plot._save(fig, title, filename)
 
     @staticmethod
     def time_elapsed_by_names(filename: str = "./logs/charts/avg_runtime.png") -> None:
         """Plot average elapsed time per function name, averaging across runs.
         @param filename  Where to save the generated chart
         """
-        df = Log.get_merged_timing()  # DataFrame with columns ['function', 'elapsed', 'call_chain', 'run_id']
-        # 1. Average per-run per-function (handles multiple calls in a run)
-        per_run_avg = df.groupby(['run_id', 'function'])['elapsed'].mean().reset_index()
-
-        # 2. Average across all runs
-        overall_avg = per_run_avg.groupby('function')['elapsed'].mean().reset_index()
+        # 1. Average per-run per-function (handles multiple calls in a run), then across all runs
+        overall_avg = Plot._overall_avg()
 
-        # 3. Plot
+        # 2. Plot
         title = "Average Function Runtime Across Runs"
-        sns.barplot(data=overall_avg, y='function', x='elapsed', orient='h')
-        plt.xlabel("Average elapsed time")
-        plt.ylabel("Function name")
-        plt.title(title)
-        plt.tight_layout()
+        fig = Plot._new_figure(layout='constrained')
+        ax = fig.subplots()
+        ax.barh(overall_avg['function'].astype(str), overall_avg['elapsed'])
+        ax.invert_yaxis()  # first function on top
+        ax.set_xlabel("Average elapsed time")
+        ax.set_ylabel("Function name")
+        ax.set_title(title)
 
-        # 4. Save the figure
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        plt.savefig(filename)
-        plt.close()
-        Log.chart(title, filename)
+        # 3. Save the figure
+        Plot._save(fig, title, filename)
 
     @staticmethod
     def time_elapsed_comparison(
@@ -80,31 +237,24 @@ class Plot:
         @param cap_outliers  Percentile to truncate large outliers. Disabled at 0 by default.
         """
         # Read data from CSV files or fall back to Log.get_merged_timing()
-        if csv1 and csv2:
-            df1 = pd.read_csv(csv1)
-            df2 = pd.read_csv(csv2)
-        else:
+        if not (csv1 and csv2):
             raise
 
-        # Process both datasets
-        def process_df(df: pd.DataFrame, only_pipeline: bool) -> pd.DataFrame:
-            # Choose or exclude functions containing "pipeline"
-            if only_pipeline:
-                df = df[df['function'].str.contains('pipeline', case=False, na=False)]
-            else:
-                df = df[~df['function'].str.contains('pipeline', case=False, na=False)]
-            per_run_avg = df.groupby(['run_id', 'function'])['elapsed'].mean().reset_index()
-            return per_run_avg.groupby('function')['elapsed'].mean().reset_index()
+        # Process both datasets: average per run while streaming, then across runs
+        def process_df(path: str) -> pd.Series:
+            run_means = Plot._stream_run_means(path, only_pipeline)
+            return run_means.groupby(level='function').mean()
 
-        if only_pipeline is not None:
-            avg1 = process_df(df1, only_pipeline)
-            avg2 = process_df(df2, only_pipeline)
+        # The CSV parsers release the GIL, so the two files load in parallel
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            avg1, avg2 = executor.map(process_df, (csv1, csv2))
 
-        # Merge on function names to align bars
-        merged = pd.merge(avg1, avg2, on='function', suffixes=('_left', '_right'))
+        # Join on the function-name index to align bars
+        merged = avg1.to_frame('elapsed_left').join(avg2.rename('elapsed_right'), how='inner', sort=False).reset_index()
 
         # Create figure
-        fig, ax = plt.subplots(figsize=(10, len(merged) * 0.5))
+        fig = Plot._new_figure(figsize=(10, len(merged) * 0.5), layout='constrained')
+        ax = fig.subplots()
 
         # Plot bars going inward from center
         y_pos = range(len(merged))
@@ -115,7 +265,8 @@ class Plot:
         if log_scale:
             ax.set_xscale('symlog', linthresh=1.0)
         if cap_outliers > 0:
-            max_val = merged[['elapsed_left', 'elapsed_right']].quantile(1 - cap_outliers).max()
+            # Per-column quantiles of one contiguous (n, 2) array, then the larger of the two
+            max_val = np.quantile(merged[['elapsed_left', 'elapsed_right']].to_numpy(), 1 - cap_outliers, axis=0).max()
             ax.set_xlim(-max_val, max_val)  # cuts off top 5%
         ax.set_yticks(y_pos)
         ax.set_yticklabels(merged['function'])
@@ -127,13 +278,8 @@ class Plot:
         ax.set_title("Average Function Runtime Comparison")
         ax.legend()
 
-        plt.tight_layout()
-
         # Save the figure
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        plt.savefig(filename)
-        plt.close()
-        Log.chart("Average Function Runtime Comparison", filename)
+        Plot._save(fig, "Average Function Runtime Comparison", filename)
 
 
 if __name__ == "__main__":
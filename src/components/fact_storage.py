@@ -1,5 +1,6 @@
+import functools
+import numpy as np
 from pandas import concat, DataFrame, option_context
-import random
 import re
 import spacy
 from src.components.relation_extraction import Triple
@@ -9,6 +10,16 @@ from typing import Any, Dict, List, Optional, Tuple
 
 
 nlp = None  # module-level cache for lazy-loaded NLP model (used by sanitize_node)
+rng = np.random.default_rng()  # module-level PCG64 generator (used by get_random_walk)
+
+# Pre-compiled sanitizer patterns (used by sanitize_node and sanitize_relation)
+_NON_ALNUM_RUN = re.compile(r"[^A-Za-z0-9]+")
+_CAMEL_BOUNDARY = re.compile(r"([a-z])([A-Z])")
+_REL_INVALID = re.compile(r"[^A-Za-z0-9_ ]")
+_REL_SEPARATORS = re.compile(r"[_ ]+")
+# Translation tables for the ASCII fast path: one C-level table lookup per character instead of the regex engine
+_NODE_TABLE = str.maketrans({chr(c): "_" for c in range(128) if not chr(c).isalnum()})
+_REL_TABLE = str.maketrans({chr(c): "_" for c in range(128) if not (chr(c).isalnum() or chr(c) in "_ ")})
 
 
 class KnowledgeGraph:
@@ -350,14 +361,15 @@ class KnowledgeGraph:
             valid_starts = list(rows_outgoing.keys())
 
         sampled_edges = []
-        for _ in range(num_walks):
-            # Choose random start
-            current = random.choice(valid_starts)
+        # Choose all random starts at once
+        start_indices = rng.integers(0, len(valid_starts), size=num_walks)
+        for start_idx in start_indices:
+            current = valid_starts[start_idx]
             for _ in range(walk_length):
                 neighbors = rows_outgoing.get(current, [])
                 if not neighbors:
                     break  # dead end
-                edge = random.choice(neighbors)  # Choose random edge from this node
+                edge = neighbors[rng.integers(0, len(neighbors))]  # Choose random edge from this node
                 sampled_edges.append(edge)
                 current = edge["object_id"]  # move along directed edge
 
@@ -646,27 +658,42 @@ def sanitize_node(label: str) -> str:
     @throws ValueError  If result is empty after sanitization
     """
     # NLP-based cleaning: remove determiners, pronouns, particles
+    cleaned = _drop_function_words(label)
+
+    # Collapse consecutive non-alphanumeric to single underscore, strip edges (regex only for non-ASCII labels)
+    if cleaned.isascii():
+        sanitized = "_".join(part for part in cleaned.translate(_NODE_TABLE).split("_") if part)
+    else:
+        sanitized = _NON_ALNUM_RUN.sub("_", cleaned).strip("_")
+    if not sanitized:
+        raise ValueError(f"Node name cannot be empty after sanitization: '{label}' -> '{cleaned}'")
+    return sanitized
+
+
+@functools.lru_cache(maxsize=4096)
+def _drop_function_words(label: str) -> str:
+    """Remove determiners, pronouns, and particles from a node label using spaCy POS tags.
+    @details
+        - Entity names repeat across triples, so each unique label is only parsed once.
+        - Only the tagger is needed for token.pos_, so the parser and NER are excluded at load time.
+    @param label  Raw node name (subject / object)
+    @return  Label without function words, or the original label if nothing remains."""
     global nlp
     if nlp is None:
         # Auto-download if missing (Self-healing)
         try:
-            nlp = spacy.load("en_core_web_sm")
+            nlp = spacy.load("en_core_web_sm", exclude=["parser", "ner", "lemmatizer"])
         except OSError:
             print("Spacy model 'en_core_web_sm' not found. Downloading...")
             spacy.cli.download("en_core_web_sm")  # type: ignore[attr-defined]
-            nlp = spacy.load("en_core_web_sm")
+            nlp = spacy.load("en_core_web_sm", exclude=["parser", "ner", "lemmatizer"])
 
     doc = nlp(label)
     tokens = [token.text for token in doc if token.pos_ not in {"DET", "PRON", "PART"}]  # determiners, pronouns, particles
     cleaned = " ".join(tokens)
     if not cleaned:  # Revert back to input: a messy label is better than nothing.
         cleaned = label
-
-    # Regex: collapse consecutive non-alphanumeric to single underscore, strip edges
-    sanitized = re.sub(r"[^A-Za-z0-9]+", "_", cleaned).strip("_")
-    if not sanitized:
-        raise ValueError(f"Node name cannot be empty after sanitization: '{label}' -> '{cleaned}'")
-    return sanitized
+    return cleaned
 
 
 def sanitize_relation(label: str, mode: str = "UPPER_CASE", default_relation: str = "RELATED_TO") -> str:
@@ -691,15 +718,15 @@ def sanitize_relation(label: str, mode: str = "UPPER_CASE", default_relation: st
     """
     # 1. PRE-PROCESS: Inject underscores between CamelCase (e.g., "hasPart" -> "has_Part")
     # This ensures re.split below sees distinct words.
-    pre_split = re.sub(r'([a-z])([A-Z])', r'\1_\2', label)
+    pre_split = _CAMEL_BOUNDARY.sub(r'\1_\2', label)
 
     # 2. CLEAN: Replace invalid chars, split on underscores/spaces
-    cleaned = re.sub(r"[^A-Za-z0-9_ ]", "_", pre_split)
-    words = [w for w in re.split(r"[_ ]+", cleaned) if w]
+    cleaned = pre_split.translate(_REL_TABLE) if pre_split.isascii() else _REL_INVALID.sub("_", pre_split)
+    words = [w for w in _REL_SEPARATORS.split(cleaned) if w]
 
     # Normalize default_relation according to mode
-    default_cleaned = re.sub(r"[^A-Za-z0-9_ ]", "_", default_relation)
-    default_words = [w for w in re.split(r"[_ ]+", default_cleaned) if w]
+    default_cleaned = _REL_INVALID.sub("_", default_relation)
+    default_words = [w for w in _REL_SEPARATORS.split(default_cleaned) if w]
 
     if mode == "UPPER_CASE":
         # Neo4j convention: SCREAMING_SNAKE_CASE
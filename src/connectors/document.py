@@ -31,6 +31,8 @@ class DocumentConnector(DatabaseConnector):
         @param verbose  Whether to print debug messages.
         """
         super().__init__(verbose)
+        ## PyMongo handles from get_unmanaged_handle(), keyed by connection string so each database connects once.
+        self._unmanaged_handles: Dict[str, "Database[Any]"] = {}
         load_dotenv(".env")
         database = os.environ["DB_NAME"]
         super().configure("MONGO", database)
@@ -129,10 +131,15 @@ class DocumentConnector(DatabaseConnector):
     def get_unmanaged_handle(self) -> MongoHandle:
         """Expose the low-level PyMongo handle for external use.
         @warning Connection remains open - use for long-lived services only.
+        @details  The handle is cached per connection string, so repeated calls (one per pipeline task) reuse
+            the same MongoClient and its connection pool instead of opening a new client every time.
         @return PyMongo database instance."""
-        alias = f"external-{int(time())}"
-        mongoengine.connect(host=self.connection_string, alias=alias)
-        return mongoengine.get_db(alias=alias)
+        handle = self._unmanaged_handles.get(self.connection_string)
+        if handle is None:
+            alias = f"external-{id(self)}-{len(self._unmanaged_handles)}"
+            mongoengine.connect(host=self.connection_string, alias=alias)
+            handle = self._unmanaged_handles[self.connection_string] = mongoengine.get_db(alias=alias)
+        return handle
 
     def execute_query(self, query: str) -> Optional[DataFrame]:
         """Send a single MongoDB command using PyMongo.
@@ -1,17 +1,35 @@
 from abc import ABC, abstractmethod
-from dotenv import load_dotenv
-from langchain_core.prompts import (
-    ChatPromptTemplate,
-    HumanMessagePromptTemplate,
-    SystemMessagePromptTemplate,
-)
+import asyncio
+from collections import OrderedDict
+import functools
+import hashlib
+import httpx
+from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 from openai import BadRequestError, OpenAI
 import os
 import re
 from src.connectors.base import Connector
-from src.util import Log
-from typing import Any, Dict, List, Tuple
+from src.util import load_env, Log
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+
+## Keep-alive limits shared by every LLM connector: reuses TCP/TLS sessions across prompts and connector instances.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+## Pooled synchronous HTTP transport for the OpenAI and LangChain clients.
+http_client = httpx.Client(limits=_HTTP_LIMITS)
+
+## Seconds before a cached prompt response expires in Redis.
+RESPONSE_CACHE_TTL = 86400
+## Most responses kept by the in-process fallback cache; the least recently used entry is evicted first.
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+## In-process fallback for the prompt response cache when Redis is not configured or unreachable.
+_response_cache: OrderedDict[str, str] = OrderedDict()
+## Guards _response_cache, which execute_batch reads and writes from several worker threads.
+_response_cache_lock = threading.Lock()
+## Set after the first Redis error, so the rest of the process uses the in-process cache without repeating the warning.
+_redis_failed = False
 
 
 class LLMConnector(Connector, ABC):
@@ -22,12 +40,15 @@ class LLMConnector(Connector, ABC):
         We prefer creating a separate wrapper instance for reusable hard-coded configurations.
     """
 
-    def __init__(self, temperature: float = 0, system_prompt: str = "You are a helpful assistant.", verbose: bool = True):
-        """Initialize common LLM connector properties."""
+    def __init__(self, temperature: float = 0, system_prompt: str = "You are a helpful assistant.", verbose: bool = True, cache: bool = False):
+        """Initialize common LLM connector properties.
+        @param cache  Whether execute_query reuses responses for repeated prompts (see @ref src.connectors.llm.LLMConnector.execute_query).
+            Off by default; only enable it for deterministic prompts, since a cached sample replaces fresh output at temperature > 0."""
         self.temperature: float = temperature
         self.system_prompt: str = system_prompt
         self.model_name: str = None
         self.verbose: bool = verbose
+        self.cache: bool = cache
 
     def test_operations(self, raise_error: bool = True) -> bool:
         """Establish a basic connection to the database, and test full functionality.
@@ -52,7 +73,7 @@ class LLMConnector(Connector, ABC):
     def _load_env(self) -> None:
         """Load environment variables and set model name.
         @details Called by subclasses during configure() to ensure consistent env loading."""
-        load_dotenv(".env")
+        load_env()
         self.model_name = os.environ["LLM_MODEL"]
 
     @abstractmethod
@@ -66,9 +87,49 @@ class LLMConnector(Connector, ABC):
 
     def execute_query(self, query: str) -> str:
         """Send a single prompt through the connection and return raw LLM output.
+        @details  When caching is enabled, repeated prompts are answered from Redis (if REDIS_HOST is set) or an in-process dict.
         @param query  A single string prompt to send to the LLM.
         @return Raw LLM response as a string."""
-        return self.execute_full_query(self.system_prompt, query)
+        if not self.cache:
+            return self.execute_full_query(self.system_prompt, query)
+
+        key = self._cache_key(self.system_prompt, query)
+        response = _cache_get(key)
+        if response is None:
+            response = self.execute_full_query(self.system_prompt, query)
+            _cache_set(key, response)
+        return response
+
+    def _cache_key(self, system_prompt: str, human_prompt: str) -> str:
+        """Hash the model settings and the exact prompts into a cache key.
+        @details  Prompts are hashed as-is, so prompts that differ only in whitespace or line layout get separate responses.
+        @param system_prompt  Instructions for the LLM.
+        @param human_prompt  The user input or query.
+        @return  A hex SHA-256 digest."""
+        raw = f"{self.model_name}|{self.temperature}|{system_prompt}|{human_prompt}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def execute_batch(self, queries: List[str], max_concurrency: int = 16) -> List[str]:
+        """Send several prompts concurrently and return raw LLM output for each.
+        @details  Overlaps network round-trips instead of looping over execute_query sequentially.
+        @param queries  A list of string prompts to send to the LLM.
+        @param max_concurrency  Maximum number of prompts in flight at once.
+        @return  Raw LLM responses as strings, in the same order as queries."""
+        return asyncio.run(self.execute_batch_async(queries, max_concurrency))
+
+    async def execute_batch_async(self, queries: List[str], max_concurrency: int = 16) -> List[str]:
+        """Async variant of @ref src.connectors.llm.LLMConnector.execute_batch for callers already inside an event loop.
+        @details  Each prompt runs the blocking execute_query in a worker thread; the pooled HTTP client and the response cache are thread-safe.
+        @param queries  A list of string prompts to send to the LLM.
+        @param max_concurrency  Maximum number of prompts in flight at once.
+        @return  Raw LLM responses as strings, in the same order as queries."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run(query: str) -> str:
+            async with semaphore:
+                return await asyncio.to_thread(self.execute_query, query)
+
+        return list(await asyncio.gather(*[_run(query) for query in queries]))
 
     def execute_file(self, filename: str) -> List[str]:
         """Run a single prompt from a file.
@@ -82,17 +143,17 @@ class LLMConnector(Connector, ABC):
 class OpenAIConnector(LLMConnector):
     """Lightweight LLM interface for faster response times."""
 
-    def __init__(self, temperature: float = 0, system_prompt: str = "You are a helpful assistant.", verbose: bool = True):
+    def __init__(self, temperature: float = 0, system_prompt: str = "You are a helpful assistant.", verbose: bool = True, cache: bool = False):
         """Initialize the connector.
         @note  Model name is specified in the .env file."""
-        super().__init__(temperature, system_prompt)
+        super().__init__(temperature, system_prompt, verbose, cache)
         self.client: OpenAI = None
         self.configure()
 
     def configure(self) -> None:
         """Initialize the OpenAI client."""
         self._load_env()
-        self.client = OpenAI()
+        self.client = OpenAI(http_client=http_client)
 
     def execute_full_query(self, system_prompt: str, human_prompt: str) -> str:
         """Send a single prompt using the OpenAI client directly for speed.
@@ -124,10 +185,10 @@ class OpenAIConnector(LLMConnector):
 class LangChainConnector(LLMConnector):
     """Fully-featured API to prompt across various LLM providers."""
 
-    def __init__(self, temperature: float = 0, system_prompt: str = "You are a helpful assistant.", verbose: bool = True):
+    def __init__(self, temperature: float = 0, system_prompt: str = "You are a helpful assistant.", verbose: bool = True, cache: bool = False):
         """Initialize the connector.
         @note  Model name is specified in the .env file."""
-        super().__init__(temperature, system_prompt)
+        super().__init__(temperature, system_prompt, verbose, cache)
         self.client: ChatOpenAI = None
         self.configure()
 
@@ -138,27 +199,99 @@ class LangChainConnector(LLMConnector):
                 - OPENAI_API_KEY from .env for authentication
                 - LLM_MODEL and LLM_TEMPERATURE to override defaults"""
         self._load_env()
-        self.client = ChatOpenAI(model=self.model_name, temperature=self.temperature, reasoning={"effort": "minimal"})
+        self.client = ChatOpenAI(
+            model=self.model_name,
+            temperature=self.temperature,
+            reasoning={"effort": "minimal"},
+            http_client=http_client,
+        )
 
     def execute_full_query(self, system_prompt: str, human_prompt: str) -> str:
         """Send a single prompt to the LLM with separate system and human instructions.
         @param system_prompt  Instructions for the LLM.
         @param human_prompt  The user input or query.
         @return Raw LLM response as a string."""
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", system_prompt),
-                ("human", human_prompt),
-            ]
-        )
+        # Build messages directly: a ChatPromptTemplate is re-validated on every call and treats braces in JSON prompts as variables.
+        messages = [SystemMessage(content=system_prompt), HumanMessage(content=human_prompt)]
         try:
-            response = self.client.invoke(prompt.format_messages())
+            response = self.client.invoke(messages)
         except BadRequestError:
-            self.client = ChatOpenAI(model=self.model_name, temperature=self.temperature)
-            response = self.client.invoke(prompt.format_messages())
+            self.client = ChatOpenAI(
+                model=self.model_name,
+                temperature=self.temperature,
+                http_client=http_client,
+            )
+            response = self.client.invoke(messages)
         return str(response.content)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_redis() -> Any:
+    """Connect to the optional Redis response cache once per process.
+    @return  A redis.Redis client, or None if REDIS_HOST is unset or the redis package is missing."""
+    load_env()
+    host = os.environ.get("REDIS_HOST")
+    if not host:
+        return None
+    try:
+        import redis
+    except ImportError:
+        Log.warn(msg="REDIS_HOST is set but the redis package is not installed. Using in-process response cache.")
+        return None
+    return redis.Redis(host=host, port=int(os.environ.get("REDIS_PORT", 6379)), decode_responses=True)
+
+
+def _redis_or_none() -> Any:
+    """Return the Redis client for the response cache, unless Redis is unconfigured or has already failed.
+    @return  A redis.Redis client, or None to use the in-process cache."""
+    return None if _redis_failed else _get_redis()
+
+
+def _redis_error(action: str, e: Exception) -> None:
+    """Switch the rest of the process to the in-process cache after a Redis error, warning only once.
+    @param action  What failed, e.g. "lookup" or "store".
+    @param e  The exception raised by the Redis client."""
+    global _redis_failed
+    _redis_failed = True
+    Log.warn(msg=f"Redis {action} failed: {e}, using in-process response cache for the rest of this run")
+
+
+def _cache_get(key: str) -> Optional[str]:
+    """Look up a cached LLM response.
+    @param key  Cache key from @ref src.connectors.llm.LLMConnector._cache_key.
+    @return  The cached response, or None on a miss."""
+    client = _redis_or_none()
+    if client is not None:
+        try:
+            return client.get(key)
+        except Exception as e:
+            _redis_error("lookup", e)
+    with _response_cache_lock:
+        response = _response_cache.get(key)
+        if response is not None:
+            _response_cache.move_to_end(key)
+    return response
+
+
+def _cache_set(key: str, response: str) -> None:
+    """Store an LLM response in the cache.
+    @details  The in-process fallback keeps at most RESPONSE_CACHE_MAX_ENTRIES responses, evicting the least recently used.
+    @param key  Cache key from @ref src.connectors.llm.LLMConnector._cache_key.
+    @param response  Raw LLM response to store."""
+    client = _redis_or_none()
+    if client is not None:
+        try:
+            client.setex(key, RESPONSE_CACHE_TTL, response)
+            return
+        except Exception as e:
+            _redis_error("store", e)
+    with _response_cache_lock:
+        _response_cache[key] = response
+        _response_cache.move_to_end(key)
+        if len(_response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+            _response_cache.popitem(last=False)
+
+
 def clean_json_block(s: str) -> str:
     # Remove leading/trailing triple backticks and optional "json" label
     s = s.strip()
@@ -282,8 +415,8 @@ def moderate_texts(texts: List[str]) -> List[bool]:
     if not texts:
         return []
 
-    load_dotenv()
-    client = OpenAI()
+    load_env()
+    client = OpenAI(http_client=http_client)
     batch_size = 32  # OpenAI's max per request
     safe_flags = []
 
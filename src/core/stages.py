@@ -165,44 +165,55 @@ def task_11_send_chunk(c, collection_name, book_title):
         # TODO: remove book_title from chunk schema?
         mongo_db = session.docs_db.get_unmanaged_handle()
         collection = getattr(mongo_db, collection_name)
-        collection.insert_one(c.to_mongo_dict())
-        collection.update_one({"_id": c.get_chunk_id()}, {"$set": {"book_title": book_title}})
+        # Write the title with the document: one round trip instead of insert + update
+        collection.insert_one({**c.to_mongo_dict(), "book_title": book_title})
+
+
+def task_11_send_chunks(chunks, collection_name, book_title):
+    with Log.timer():
+        mongo_db = session.docs_db.get_unmanaged_handle()
+        collection = getattr(mongo_db, collection_name)
+        # Single insert_many round trip; unordered so the server can apply the writes in parallel
+        collection.insert_many([{**c.to_mongo_dict(), "book_title": book_title} for c in chunks], ordered=False)
 
 
 # TODO: 11, 12, 13 fit better as preprocessing tasks
 # tied to pipeline_B -> pipeline_A
 
 
-def task_12_relation_extraction_rebel(text, max_tokens=1024):
+def task_12_relation_extraction_rebel(text, max_tokens=1024, nlp=None):
     with Log.timer():
         from src.components.relation_extraction import RelationExtractorREBEL
 
         # TODO: move to session.rel_extract
-        re_rebel = "Babelscape/rebel-large"
-        # TODO: different models
-        # re_rst = "GAIR/rst-information-extraction-11b"
-        # ner_renard = "compnet-renard/bert-base-cased-literary-NER"
-        nlp = RelationExtractorREBEL(model_name=re_rebel, max_tokens=max_tokens)
+        if nlp is None:
+            re_rebel = "Babelscape/rebel-large"
+            # TODO: different models
+            # re_rst = "GAIR/rst-information-extraction-11b"
+            # ner_renard = "compnet-renard/bert-base-cased-literary-NER"
+            nlp = RelationExtractorREBEL(model_name=re_rebel, max_tokens=max_tokens)
         extracted = nlp.extract(text)
         return extracted
 
 
-def task_12_relation_extraction_openie(text, memory='4G'):
+def task_12_relation_extraction_openie(text, memory='4G', nlp=None):
     with Log.timer():
         from src.components.relation_extraction import RelationExtractorOpenIE
 
         # Initialize OpenIE wrapper (handles CoreNLP server internally)
-        nlp = RelationExtractorOpenIE(memory=memory)
+        if nlp is None:
+            nlp = RelationExtractorOpenIE(memory=memory)
         extracted = nlp.extract(text)
         return extracted
 
 
-def task_12_relation_extraction_textacy(text):
+def task_12_relation_extraction_textacy(text, nlp=None):
     with Log.timer():
         from src.components.relation_extraction import RelationExtractorTextacy
 
         # Initialize Textacy wrapper (pure Python backup)
-        nlp = RelationExtractorTextacy()
+        if nlp is None:
+            nlp = RelationExtractorTextacy()
         extracted = nlp.extract(text)
         return extracted
 
@@ -210,10 +221,8 @@ def task_12_relation_extraction_textacy(text):
 def task_13_concatenate_triples(extracted):
     with Log.timer():
         # TODO: to_triples_string in RelationExtractor?
-        triples_string = ""
-        for triple in extracted:
-            triples_string += str(triple) + "\n"
-        return triples_string
+        # One join instead of repeated += (each += may copy the whole string so far)
+        return "".join(f"{triple}\n" for triple in extracted)
 
 
 def task_14_relation_extraction_llm_langchain(triples_string, text):
@@ -1,5 +1,7 @@
 from contextlib import contextmanager
+from dotenv import load_dotenv
 import functools
+from importlib.util import find_spec
 import inspect
 from inspect import FrameInfo
 import os
@@ -297,6 +299,14 @@ class Log:
         df = DataFrame(Log._timing_results, columns=['function', 'elapsed', 'call_chain', "run_id"])
         return df
 
+    @staticmethod
+    def get_timing_state() -> Tuple[int, int, Optional[Tuple[str, float, str, int]]]:
+        """Identify the in-memory timing data without copying it, e.g. for use as a cache key.
+        @return  Tuple of the current run_id, the number of timing records, and the most recent record (None if empty).
+        """
+        records = Log._timing_results
+        return Log.run_id, len(records), records[-1] if records else None
+
     @staticmethod
     def get_merged_timing(file_path: str = "./logs/elapsed_time.csv") -> DataFrame:
         """Reads the existing file, deletes rows matching this run_id, and adds current data.
@@ -309,7 +319,8 @@ class Log:
         if not os.path.exists(file_path):
             return current_df
         try:
-            existing_df = read_csv(file_path)
+            # pyarrow's multi-threaded parser builds each column buffer directly, when it is installed
+            existing_df = read_csv(file_path, engine="pyarrow" if find_spec("pyarrow") else "c")
             # Remove rows with the current run_id
             existing_df = existing_df[existing_df['run_id'] != Log.run_id]
         except:
@@ -335,7 +346,9 @@ class Log:
                 header_exists = bool(first_line and not first_line[0].isdigit())
 
         df = Log.get_merged_timing()
-        df.to_csv(file_path, mode="a", index=False, header=not header_exists)
+        # One large write buffer instead of the default 8 KiB flushes
+        with open(file_path, "a", buffering=1 << 20, newline="") as f:
+            df.to_csv(f, index=False, header=not header_exists)
         Log.time_message(prefix=Log.t_dump, msg=Log.msg_time_dump(file_path))
 
     t_dump = "[DUMP] "
@@ -522,3 +535,10 @@ def check_values(results: List[Any], expected: List[Any], verbose: bool, log_sou
                 raise Log.Failure(log_source + Log.bad_val, Log.msg_compare(results[i], expected[i])) from None
             return False
     return True
+
+
+@functools.lru_cache(maxsize=1)
+def load_env() -> None:
+    """Parse the .env file once per process.
+    @details  Used by components that are constructed repeatedly (LLM connectors, relation extractors)."""
+    load_dotenv(".env")
@@ -18,7 +18,7 @@ def book_data(request):
     return request.getfixturevalue(request.param)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def book_1_data():
     """Example data for Book 1: Five Children and It"""
     sample_chunk = Chunk(
@@ -72,7 +72,7 @@ def book_1_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def book_2_data():
     """Example data for Book 2: The Phoenix and the Carpet - realistic pipeline data"""
     chunk_1_id = "story-2_book-2_chapter-1_p.25000"
@@ -365,6 +365,30 @@ def test_job_11_send_chunk(docs_db, book_data):
     assert doc["text"] == chunk.text
 
 
+@pytest.mark.task
+@pytest.mark.stage_B
+@pytest.mark.order(11)
+@pytest.mark.dependency(name="job_11_multi", scope="session")
+@pytest.mark.parametrize("book_data", ["book_1_data", "book_2_data"], indirect=True)
+def test_job_11_send_chunks(docs_db, book_data):
+    """Test inserting several chunks into MongoDB with one batched write."""
+    chunks = book_data["chunks_list"]
+    collection_name = "example_chunks"
+    book_title = book_data["book_title"]
+
+    task_11_send_chunks(chunks, collection_name, book_title)
+
+    # Verify every chunk was inserted with correct book_title
+    mongo_db = docs_db.get_unmanaged_handle()
+    collection = getattr(mongo_db, collection_name)
+    docs = {doc["_id"]: doc for doc in collection.find({"_id": {"$in": [c.get_chunk_id() for c in chunks]}})}
+
+    assert len(docs) == len(chunks)
+    for chunk in chunks:
+        assert docs[chunk.get_chunk_id()]["book_title"] == book_title
+        assert docs[chunk.get_chunk_id()]["text"] == chunk.text
+
+
 @pytest.mark.task
 @pytest.mark.stage_B
 @pytest.mark.order(13)
@@ -511,7 +535,7 @@ def test_job_31_send_summary(docs_db, book_data):
     # Verify summary was added
     mongo_db = docs_db.get_unmanaged_handle()
     collection = getattr(mongo_db, collection_name)
-    doc = collection.find_one({"_id": chunk.get_chunk_id()})
+    doc = collection.find_one({"_id": chunk.get_chunk_id()}, {"summary": 1})
 
     assert doc is not None
     assert doc["summary"] == summary